@@ -1,13 +1,204 @@
 import serial
 import serial.tools.list_ports
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, font as tkfont
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
+import functools
+import io
+import logging
+import os
+import queue
+import select
 import time
-from threading import Thread, Lock
+from threading import Thread, Event, Lock
+
+try:
+    from numba import njit
+except ImportError:  # Optional - measurements fall back to plain NumPy
+    njit = None
+
+log = logging.getLogger(__name__)
+
+# Largest single capture, and the sample ring holding recent frames
+SCOPE_MAX_SAMPLES = 4096
+SCOPE_RING_SIZE = 4 * SCOPE_MAX_SAMPLES
+
+# Binary capture frame: "SCOPE_BIN:<count>\n" followed by <count> packed
+# records of uint16 time (us, so up to ~65 ms) and uint8 ADC reading
+# (0-255 = 0-3.3 V). 3 bytes per sample instead of ~14 for "t,v\r\n" text.
+# The time field is the low 16 bits of micros() and may wrap mid-frame.
+SCOPE_BIN_HEADER = b"SCOPE_BIN:"
+SCOPE_BIN_RECORD = np.dtype([('t', '<u2'), ('v', 'u1')])
+
+# Plotted traces are reduced to min/max pairs, one bucket per pixel column
+# of the plot area. This is the bucket count used until the first draw.
+SCOPE_PLOT_BUCKETS = 1000
+
+# Minimum time between display refreshes (s), capping redraws at ~30 FPS
+SCOPE_REFRESH_INTERVAL = 1 / 30
+
+# Measurement readouts, formatted together in one template pass
+SCOPE_READOUT_KEYS = ('vmax', 'vmin', 'vpp', 'vavg', 'freq')
+SCOPE_READOUT_FORMAT = "{vmax:.3f}|{vmin:.3f}|{vpp:.3f}|{vavg:.3f}|{freq:.1f}"
+
+@functools.lru_cache(maxsize=4)
+def _bucket_bounds(n, buckets):
+    """First and last sample index of each decimation bucket"""
+    starts = (np.arange(buckets) * n) // buckets
+    ends = np.append(starts[1:], n) - 1
+    starts.flags.writeable = False
+    ends.flags.writeable = False
+    return starts, ends
+
+def decimate_minmax(time_data, voltage_data, buckets):
+    """Reduce a trace to a min/max pair per bucket, keeping spikes visible
+
+    time_data may be None when only the voltage trace is needed.
+    """
+    n = len(voltage_data)
+    if n <= 2 * buckets:
+        return time_data, voltage_data
+        
+    starts, ends = _bucket_bounds(n, buckets)
+    
+    t = None
+    if time_data is not None:
+        t = np.empty(2 * buckets, dtype=time_data.dtype)
+        t[0::2] = time_data[starts]
+        t[1::2] = time_data[ends]
+    v = np.empty(2 * buckets, dtype=voltage_data.dtype)
+    v[0::2] = np.minimum.reduceat(voltage_data, starts)
+    v[1::2] = np.maximum.reduceat(voltage_data, starts)
+    return t, v
+
+def _scope_stats_numpy(v):
+    """Return (v_min, v_max, v_avg, rising mean crossings) of a float32 frame"""
+    v_min = v.min()
+    v_max = v.max()
+    v_avg = v.mean()
+    # One comparison pass; a rising crossing is a False -> True step
+    above = v >= v_avg
+    crossings = int(np.count_nonzero(above[1:] & ~above[:-1]))
+    return v_min, v_max, v_avg, crossings
+
+def _scope_stats_loop(v):
+    """Same as _scope_stats_numpy as a min/max/sum loop then a crossing loop"""
+    n = v.shape[0]
+    v_min = v[0]
+    v_max = v[0]
+    total = 0.0
+    for i in range(n):
+        x = v[i]
+        if x < v_min:
+            v_min = x
+        if x > v_max:
+            v_max = x
+        total += x
+    v_avg = total / n
+    
+    # Second pass over the still-cached frame; carrying the previous
+    # comparison keeps it to one load per sample
+    crossings = 0
+    was_above = v[0] >= v_avg
+    for i in range(1, n):
+        above = v[i] >= v_avg
+        if above and not was_above:
+            crossings += 1
+        was_above = above
+    return v_min, v_max, v_avg, crossings
+
+# Compiled fused kernel when Numba is installed
+if njit is not None:
+    scope_stats = njit(cache=True, fastmath=True, nogil=True)(_scope_stats_loop)
+else:
+    scope_stats = _scope_stats_numpy
+
+@functools.lru_cache(maxsize=4)
+def _hann(n):
+    """Float32 Hann window of length n, built once per capture length"""
+    return np.hanning(n).astype(np.float32)
+
+@functools.lru_cache(maxsize=4)
+def _lag_counts(n):
+    """Number of sample products behind each autocorrelation lag"""
+    counts = np.arange(n, 0, -1, dtype=np.float64)
+    counts.flags.writeable = False
+    return counts
+
+def _parabolic_offset(a, b, c):
+    """Offset of the vertex of the parabola through three equally spaced points"""
+    denom = a - 2 * b + c
+    return 0.5 * (a - c) / denom if denom else 0.0
+
+def autocorr_period(v, v_avg):
+    """Period of the frame in samples from its first autocorrelation peak
+
+    Returns 0.0 when the frame does not hold two clear cycles.
+    """
+    n = len(v)
+    if n < 4:
+        return 0.0
+    # Wiener-Khinchin: |FFT|^2, zero padded so the correlation doesn't wrap
+    nfft = 1 << (2 * n - 1).bit_length()
+    spec = np.fft.rfft(v - v_avg, nfft)
+    ac = np.fft.irfft(spec.real ** 2 + spec.imag ** 2, nfft)[:n]
+    ac /= _lag_counts(n)  # Unbiased, so later peaks aren't tapered down
+    
+    # Past the zero-lag lobe, the first lobe back above half the zero-lag
+    # power is one period; longer lags average too few products to trust
+    limit = n // 2
+    below = np.flatnonzero(ac[:limit] < 0)
+    if not len(below):
+        return 0.0
+    rise = np.flatnonzero(ac[below[0]:limit] > 0.5 * ac[0])
+    if not len(rise):
+        return 0.0
+    lo = below[0] + rise[0]
+    fall = np.flatnonzero(ac[lo:limit] <= 0.5 * ac[0])
+    hi = lo + fall[0] if len(fall) else limit
+    k = lo + int(np.argmax(ac[lo:hi]))
+    
+    if k + 1 < n:
+        return k + _parabolic_offset(ac[k - 1], ac[k], ac[k + 1])
+    return float(k)
+
+def estimate_frequency(v, v_avg, dt):
+    """Dominant frequency (cycles per unit of dt) from the windowed FFT peak
+
+    When the autocorrelation period puts the fundamental well below the
+    largest bin, and the spectrum has real energy there, the peak is taken
+    to be a harmonic and the fundamental's bin is used instead.
+    """
+    n = len(v)
+    if n < 4:
+        return 0.0
+    spectrum = np.abs(np.fft.rfft((v - v_avg) * _hann(n)))
+    k = int(np.argmax(spectrum[1:])) + 1  # Skip the DC bin
+    
+    period = autocorr_period(v, v_avg)
+    if period > 0:
+        k0 = n / period
+        # The lag estimate is coarse for short periods, so only a peak
+        # near a whole multiple of it counts as a harmonic, and only a
+        # fundamental within 30% of the peak's magnitude replaces it
+        width = max(1.0, 0.1 * k0)
+        m = round(k / k0)
+        if m >= 2 and abs(k - m * k0) <= m * width:
+            lo = max(1, int(np.ceil(k0 - width)))
+            hi = min(len(spectrum) - 1, int(k0 + width) + 1)
+            if lo < hi:
+                kf = lo + int(np.argmax(spectrum[lo:hi]))
+                if spectrum[kf] >= 0.7 * spectrum[k]:
+                    k = kf
+    
+    # Refine between bins with a parabola through the log magnitudes
+    delta = 0.0
+    if k < len(spectrum) - 1:
+        delta = _parabolic_offset(*np.log(spectrum[k - 1:k + 2] + 1e-12))
+    return (k + delta) / (n * dt)
 
 class ESP32Oscilloscope:
     def __init__(self, root):
@@ -20,19 +211,86 @@ class ESP32Oscilloscope:
         self.ser = None
         self.connected = False
         self.demo_mode = False
-        self.data_lock = Lock()
         self.running = False
-        self.auto_capture = False
-        
-        # Data storage
-        self.scope_data = {'time': [], 'voltage': []}
+        self._run_stop = Event()
+        self._pending_draw = False
+        self._last_draw = 0.0
+        
+        # Data storage - single-producer/single-consumer sample ring.
+        # The capture side copies a frame in after the previous one and
+        # then publishes (start, count, dt) with one assignment, so the
+        # display reads the latest frame without taking a lock. Samples are
+        # evenly spaced, so only voltages are stored; time is index * dt.
+        self._rb_v = np.empty(SCOPE_RING_SIZE, np.float32)
+        self._sample_index = np.arange(SCOPE_MAX_SAMPLES, dtype=np.float32)
+        self._sample_index.flags.writeable = False
+        self._head = 0
+        self._frame = (0, 0, 0.0, None)
+        # Ring range the display is reading, which producers must skip
+        self._reading = None
+        # Held while a frame is produced, so SINGLE, RUN and a capture
+        # still finishing after STOP can't fill the ring at the same time
+        self._produce_lock = Lock()
+        # Sample interval (ms) of the current source
+        self.dt = 0.0
+        # Last formatted readout line and its split texts, see _format_readouts
+        self._readout_text = None
+        self._readouts = None
+        
+        # Compile (or load the cached) stats kernel now rather than on
+        # the first capture
+        scope_stats(np.zeros(2, np.float32))
+        
+        # Demo mode time axis (ms) and scratch buffers, allocated once
+        self._time_axis = np.linspace(0, 100, 1000, dtype=np.float32)
+        self._demo_signal = np.empty_like(self._time_axis)
+        self._demo_noise = np.empty_like(self._time_axis)
+        self._demo_idx = np.empty(len(self._time_axis), np.int32)
+        self._demo_dt = 100 / (len(self._time_axis) - 1)
+        self._rng = np.random.default_rng()
+        
+        # One period of each demo waveform, indexed by a phase accumulator
+        # (DDS style) so generating a frame needs no sin/abs per sample
+        phase = np.arange(4096, dtype=np.float32) / 4096
+        self._lut = {
+            'SINE': np.sin(2 * np.pi * phase),
+            'SQUARE': np.where(phase < 0.5, 1, -1).astype(np.float32),
+            'TRIANGLE': np.abs(4 * phase - 2) - 1,
+            'SAWTOOTH': 2 * phase - 1,
+        }
         
         # Generator settings
         self.gen_active = False
         
+        # Pending slider sends (Tk after ids) for debouncing
+        self._freq_after_id = None
+        self._amp_after_id = None
+        
+        # Outgoing commands, written to the port by _tx_worker
+        self._tx_q = queue.Queue()
+        Thread(target=self._tx_worker, daemon=True).start()
+        
+        # Shared font objects for the widgets, resolved once by Tk
+        self._mono7 = tkfont.Font(family='Courier New', size=7)
+        self._mono8 = tkfont.Font(family='Courier New', size=8)
+        self._mono9 = tkfont.Font(family='Courier New', size=9)
+        self._mono9b = tkfont.Font(family='Courier New', size=9, weight='bold')
+        self._mono10b = tkfont.Font(family='Courier New', size=10, weight='bold')
+        self._mono11b = tkfont.Font(family='Courier New', size=11, weight='bold')
+        self._mono12b = tkfont.Font(family='Courier New', size=12, weight='bold')
+        self._mono14b = tkfont.Font(family='Courier New', size=14, weight='bold')
+        self._digital16b = tkfont.Font(family='DS-Digital', size=16, weight='bold')
+        
         # Create professional UI
         self.create_ui()
         
+        # Python-side copies of the generator settings, kept current by
+        # update_frequency/amplitude/waveform so the demo generator (which
+        # also runs on the RUN thread) never has to call into Tcl
+        self._freq_cache = self.freq_var.get()
+        self._amp_cache = self.amp_var.get()
+        self._wave_cache = self.wave_var.get()
+        
         # Check for connection
         self.check_startup()
         
@@ -53,7 +311,7 @@ class ESP32Oscilloscope:
         
         self.status_text = tk.Label(top_bar, text="DISCONNECTED", 
                                     bg='#1a1a1a', fg='#ff0000', 
-                                    font=('Courier New', 10, 'bold'))
+                                    font=self._mono10b)
         self.status_text.pack(side=tk.RIGHT, padx=5)
         
         # Main container
@@ -79,7 +337,7 @@ class ESP32Oscilloscope:
     def create_connection_panel(self, parent):
         """Connection control panel"""
         frame = tk.LabelFrame(parent, text="║ CONNECTION ║", bg='#0a0a0a', 
-                             fg='#00ff00', font=('Courier New', 11, 'bold'),
+                             fg='#00ff00', font=self._mono11b,
                              bd=2, relief=tk.GROOVE)
         frame.pack(fill=tk.X, padx=10, pady=10)
         
@@ -88,14 +346,14 @@ class ESP32Oscilloscope:
         port_frame.pack(fill=tk.X, padx=10, pady=5)
         
         tk.Label(port_frame, text="PORT:", bg='#0a0a0a', fg='#888888',
-                font=('Courier New', 9)).pack(side=tk.LEFT, padx=5)
+                font=self._mono9).pack(side=tk.LEFT, padx=5)
         
         self.port_var = tk.StringVar()
         self.port_combo = ttk.Combobox(port_frame, textvariable=self.port_var,
                                        state='readonly', width=20,
-                                       font=('Courier New', 9))
+                                       font=self._mono9)
         self.port_combo.pack(side=tk.LEFT, padx=5)
-        self.refresh_ports()
+        # Port list is filled in by check_startup's background scan
         
         # Control buttons
         btn_frame = tk.Frame(frame, bg='#0a0a0a')
@@ -104,7 +362,7 @@ class ESP32Oscilloscope:
         self.connect_btn = tk.Button(btn_frame, text="CONNECT",
                                      command=self.toggle_connection,
                                      bg='#004400', fg='#00ff00',
-                                     font=('Courier New', 10, 'bold'),
+                                     font=self._mono10b,
                                      activebackground='#006600',
                                      relief=tk.RAISED, bd=3, width=15)
         self.connect_btn.pack(side=tk.LEFT, padx=2, pady=5)
@@ -112,7 +370,7 @@ class ESP32Oscilloscope:
         refresh_btn = tk.Button(btn_frame, text="REFRESH",
                                command=self.refresh_ports,
                                bg='#1a3a5a', fg='#00aaff',
-                               font=('Courier New', 10, 'bold'),
+                               font=self._mono10b,
                                activebackground='#2a4a6a',
                                relief=tk.RAISED, bd=3, width=15)
         refresh_btn.pack(side=tk.LEFT, padx=2, pady=5)
@@ -121,7 +379,7 @@ class ESP32Oscilloscope:
         self.demo_btn = tk.Button(frame, text="DEMO MODE",
                                  command=self.toggle_demo_mode,
                                  bg='#3a1a5a', fg='#ff00ff',
-                                 font=('Courier New', 10, 'bold'),
+                                 font=self._mono10b,
                                  activebackground='#4a2a6a',
                                  relief=tk.RAISED, bd=3)
         self.demo_btn.pack(fill=tk.X, padx=10, pady=5)
@@ -130,13 +388,13 @@ class ESP32Oscilloscope:
         """Function generator controls"""
         frame = tk.LabelFrame(parent, text="║ FUNCTION GENERATOR ║", 
                              bg='#0a0a0a', fg='#ffaa00',
-                             font=('Courier New', 11, 'bold'),
+                             font=self._mono11b,
                              bd=2, relief=tk.GROOVE)
         frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Waveform selection
         wave_frame = tk.LabelFrame(frame, text="WAVEFORM", bg='#0a0a0a',
-                                  fg='#888888', font=('Courier New', 9))
+                                  fg='#888888', font=self._mono9)
         wave_frame.pack(fill=tk.X, padx=10, pady=5)
         
         self.wave_var = tk.StringVar(value="SINE")
@@ -152,13 +410,13 @@ class ESP32Oscilloscope:
             rb = tk.Radiobutton(wave_frame, text=text, variable=self.wave_var,
                                value=value, bg='#0a0a0a', fg=color,
                                selectcolor='#1a1a1a', activebackground='#0a0a0a',
-                               font=('Courier New', 9, 'bold'),
+                               font=self._mono9b,
                                command=self.update_waveform)
             rb.pack(anchor=tk.W, padx=10, pady=2)
         
         # Frequency control
         freq_frame = tk.LabelFrame(frame, text="FREQUENCY (Hz)", bg='#0a0a0a',
-                                  fg='#888888', font=('Courier New', 9))
+                                  fg='#888888', font=self._mono9)
         freq_frame.pack(fill=tk.X, padx=10, pady=5)
         
         self.freq_var = tk.IntVar(value=1000)
@@ -168,11 +426,11 @@ class ESP32Oscilloscope:
         freq_entry_frame.pack(padx=10, pady=5)
         
         tk.Label(freq_entry_frame, text="Enter:", bg='#0a0a0a', fg='#888888',
-                font=('Courier New', 9)).pack(side=tk.LEFT, padx=5)
+                font=self._mono9).pack(side=tk.LEFT, padx=5)
         
         self.freq_entry = tk.Entry(freq_entry_frame, textvariable=self.freq_var,
                                    bg='#000000', fg='#00ff00',
-                                   font=('Courier New', 14, 'bold'),
+                                   font=self._mono14b,
                                    width=10, justify=tk.CENTER,
                                    insertbackground='#00ff00')
         self.freq_entry.pack(side=tk.LEFT, padx=5)
@@ -182,13 +440,13 @@ class ESP32Oscilloscope:
         self.freq_entry.bind('<KeyRelease>', self.on_freq_key_release)
         
         tk.Label(freq_entry_frame, text="Hz", bg='#0a0a0a', fg='#00ff00',
-                font=('Courier New', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+                font=self._mono10b).pack(side=tk.LEFT, padx=5)
         
         # Add SET button for manual entry
         set_freq_btn = tk.Button(freq_entry_frame, text="SET",
                                 command=self.validate_and_update_freq,
                                 bg='#004400', fg='#00ff00',
-                                font=('Courier New', 9, 'bold'),
+                                font=self._mono9b,
                                 activebackground='#006600',
                                 relief=tk.RAISED, bd=2, width=5)
         set_freq_btn.pack(side=tk.LEFT, padx=5)
@@ -208,13 +466,13 @@ class ESP32Oscilloscope:
             btn = tk.Button(quick_freq, text=f"{freq}Hz",
                            command=lambda f=freq: self.set_frequency(f),
                            bg='#1a1a1a', fg='#888888',
-                           font=('Courier New', 7), width=6,
+                           font=self._mono7, width=6,
                            activebackground='#2a2a2a')
             btn.pack(side=tk.LEFT, padx=2)
         
         # Amplitude control
         amp_frame = tk.LabelFrame(frame, text="AMPLITUDE (0-255)", bg='#0a0a0a',
-                                 fg='#888888', font=('Courier New', 9))
+                                 fg='#888888', font=self._mono9)
         amp_frame.pack(fill=tk.X, padx=10, pady=5)
         
         self.amp_var = tk.IntVar(value=200)
@@ -224,11 +482,11 @@ class ESP32Oscilloscope:
         amp_entry_frame.pack(padx=10, pady=5)
         
         tk.Label(amp_entry_frame, text="Enter:", bg='#0a0a0a', fg='#888888',
-                font=('Courier New', 9)).pack(side=tk.LEFT, padx=5)
+                font=self._mono9).pack(side=tk.LEFT, padx=5)
         
         self.amp_entry = tk.Entry(amp_entry_frame, textvariable=self.amp_var,
                                  bg='#000000', fg='#ffaa00',
-                                 font=('Courier New', 14, 'bold'),
+                                 font=self._mono14b,
                                  width=10, justify=tk.CENTER,
                                  insertbackground='#ffaa00')
         self.amp_entry.pack(side=tk.LEFT, padx=5)
@@ -241,7 +499,7 @@ class ESP32Oscilloscope:
         set_amp_btn = tk.Button(amp_entry_frame, text="SET",
                                command=self.validate_and_update_amp,
                                bg='#443300', fg='#ffaa00',
-                               font=('Courier New', 9, 'bold'),
+                               font=self._mono9b,
                                activebackground='#665500',
                                relief=tk.RAISED, bd=2, width=5)
         set_amp_btn.pack(side=tk.LEFT, padx=5)
@@ -257,7 +515,7 @@ class ESP32Oscilloscope:
         self.gen_btn = tk.Button(frame, text="OUTPUT: OFF",
                                 command=self.toggle_generator,
                                 bg='#440000', fg='#ff0000',
-                                font=('Courier New', 12, 'bold'),
+                                font=self._mono12b,
                                 activebackground='#660000',
                                 relief=tk.RAISED, bd=4, height=2)
         self.gen_btn.pack(fill=tk.X, padx=10, pady=10)
@@ -266,7 +524,7 @@ class ESP32Oscilloscope:
         """Oscilloscope control panel"""
         frame = tk.LabelFrame(parent, text="║ OSCILLOSCOPE CONTROLS ║",
                              bg='#0a0a0a', fg='#00ffff',
-                             font=('Courier New', 11, 'bold'),
+                             font=self._mono11b,
                              bd=2, relief=tk.GROOVE)
         frame.pack(fill=tk.X, padx=10, pady=10)
         
@@ -274,7 +532,7 @@ class ESP32Oscilloscope:
         single_btn = tk.Button(frame, text="◉ SINGLE",
                               command=self.capture_single,
                               bg='#1a3a5a', fg='#00aaff',
-                              font=('Courier New', 11, 'bold'),
+                              font=self._mono11b,
                               activebackground='#2a4a6a',
                               relief=tk.RAISED, bd=3, height=2)
         single_btn.pack(fill=tk.X, padx=10, pady=5)
@@ -283,7 +541,7 @@ class ESP32Oscilloscope:
         self.run_btn = tk.Button(frame, text="▶ RUN",
                                 command=self.toggle_run,
                                 bg='#004400', fg='#00ff00',
-                                font=('Courier New', 11, 'bold'),
+                                font=self._mono11b,
                                 activebackground='#006600',
                                 relief=tk.RAISED, bd=3, height=2)
         self.run_btn.pack(fill=tk.X, padx=10, pady=5)
@@ -292,7 +550,7 @@ class ESP32Oscilloscope:
         clear_btn = tk.Button(frame, text="⌧ CLEAR",
                              command=self.clear_display,
                              bg='#440000', fg='#ff4444',
-                             font=('Courier New', 11, 'bold'),
+                             font=self._mono11b,
                              activebackground='#660000',
                              relief=tk.RAISED, bd=3, height=2)
         clear_btn.pack(fill=tk.X, padx=10, pady=5)
@@ -308,19 +566,25 @@ class ESP32Oscilloscope:
         
         self.mode_label = tk.Label(header, text="[ DISCONNECTED ]",
                                    bg='#000000', fg='#ff0000',
-                                   font=('Courier New', 12, 'bold'))
+                                   font=self._mono12b)
         self.mode_label.pack(pady=5)
         
         # Create matplotlib figure with oscilloscope styling
-        self.fig = Figure(figsize=(11, 6), facecolor='#000000')
-        self.ax = self.fig.add_subplot(111, facecolor='#001a00')
+        # Tick style comes from rcParams at axes creation
+        scope_rc = {
+            'xtick.color': '#00aa00', 'ytick.color': '#00aa00',
+            'xtick.labelsize': 9, 'ytick.labelsize': 9,
+            'xtick.major.width': 2, 'ytick.major.width': 2,
+        }
+        with plt.rc_context(scope_rc):
+            self.fig = Figure(figsize=(11, 6), facecolor='#000000')
+            self.ax = self.fig.add_subplot(111, facecolor='#001a00')
         
         # Oscilloscope grid styling
         self.ax.set_xlabel('Time (ms)', color='#00ff00', fontsize=11, 
                           fontfamily='monospace', fontweight='bold')
         self.ax.set_ylabel('Voltage (V)', color='#00ff00', fontsize=11,
                           fontfamily='monospace', fontweight='bold')
-        self.ax.tick_params(colors='#00aa00', labelsize=9, width=2)
         
         # Major and minor grid like real oscilloscope
         self.ax.grid(True, which='major', alpha=0.4, color='#00ff00', linewidth=1.5)
@@ -329,24 +593,41 @@ class ESP32Oscilloscope:
         
         self.ax.set_xlim(0, 100)
         self.ax.set_ylim(0, 6.6)
+        self._xlim_cached = (0, 100)
         
         # Waveform trace - bright green like CRT
+        # Animated so full redraws leave it out of the cached background
         self.line, = self.ax.plot([], [], color='#00ff00', linewidth=2.5, 
-                                  antialiased=True, linestyle='-')
+                                  antialiased=True, linestyle='-',
+                                  animated=True)
+        # (frame samples, plot buckets) behind the trace's current x data
+        self._line_key = (0, 0, 0.0)
+        self._plot_buckets = SCOPE_PLOT_BUCKETS
         
         # Embed canvas
         self.canvas = FigureCanvasTkAgg(self.fig, display_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # Background for blitting, refreshed on every full draw (incl. resize)
+        self._bg = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        
         self.fig.tight_layout()
         
+    def _on_draw(self, event):
+        """Cache the static axes background and draw the trace on top"""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        # Plot area width only changes with a full draw (e.g. resize)
+        self._plot_buckets = max(1, int(self.ax.bbox.width))
+        self.ax.draw_artist(self.line)
+        
     def create_measurements_panel(self, parent):
         """Measurement display panel"""
         frame = tk.Frame(parent, bg='#0a0a0a', relief=tk.SUNKEN, bd=3)
         frame.pack(fill=tk.X, padx=5, pady=5)
         
         tk.Label(frame, text="MEASUREMENTS", bg='#0a0a0a', fg='#00ffff',
-                font=('Courier New', 11, 'bold')).pack(pady=5)
+                font=self._mono11b).pack(pady=5)
         
         # Measurement displays
         meas_container = tk.Frame(frame, bg='#0a0a0a')
@@ -360,7 +641,10 @@ class ESP32Oscilloscope:
             ("Freq", "freq", "Hz")
         ]
         
-        self.meas_labels = {}
+        # Readout text lives in StringVars; _meas_text mirrors the shown
+        # values so unchanged readouts skip the Tk call entirely
+        self.meas_vars = {}
+        self._meas_text = {}
         
         for i, (label, key, unit) in enumerate(measurements):
             meas_frame = tk.Frame(meas_container, bg='#000000', 
@@ -368,16 +652,16 @@ class ESP32Oscilloscope:
             meas_frame.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.BOTH, expand=True)
             
             tk.Label(meas_frame, text=label, bg='#000000', fg='#888888',
-                    font=('Courier New', 9)).pack()
+                    font=self._mono9).pack()
             
-            value_label = tk.Label(meas_frame, text="----", bg='#000000',
-                                  fg='#00ff00', font=('DS-Digital', 16, 'bold'))
-            value_label.pack()
+            self.meas_vars[key] = tk.StringVar(value="----")
+            self._meas_text[key] = "----"
+            tk.Label(meas_frame, textvariable=self.meas_vars[key],
+                    bg='#000000', fg='#00ff00',
+                    font=self._digital16b).pack()
             
             tk.Label(meas_frame, text=unit, bg='#000000', fg='#888888',
-                    font=('Courier New', 8)).pack()
-            
-            self.meas_labels[key] = value_label
+                    font=self._mono8).pack()
     
     def on_freq_key_release(self, event=None):
         """Handle key release in frequency entry - for Enter key"""
@@ -399,7 +683,7 @@ class ESP32Oscilloscope:
                 freq = 50000
             self.freq_var.set(freq)
             self.update_frequency()
-            print(f"Frequency set to: {freq} Hz")  # Debug
+            log.debug("Frequency set to: %d Hz", freq)
         except ValueError:
             self.freq_var.set(1000)  # Reset to default
             messagebox.showerror("Invalid Input", "Frequency must be a number between 1 and 50000 Hz")
@@ -414,40 +698,60 @@ class ESP32Oscilloscope:
                 amp = 255
             self.amp_var.set(amp)
             self.update_amplitude()
-            print(f"Amplitude set to: {amp}")  # Debug
+            log.debug("Amplitude set to: %d", amp)
         except ValueError:
             self.amp_var.set(200)  # Reset to default
             messagebox.showerror("Invalid Input", "Amplitude must be a number between 0 and 255")
     
     def update_frequency_from_slider(self, value):
-        """Update frequency from slider movement"""
-        self.update_frequency()
+        """Update frequency from slider movement, sending only the final value"""
+        if self._freq_after_id:
+            self.root.after_cancel(self._freq_after_id)
+        self._freq_after_id = self.root.after(80, self._send_slider_frequency)
     
     def update_amplitude_from_slider(self, value):
-        """Update amplitude from slider movement"""
+        """Update amplitude from slider movement, sending only the final value"""
+        if self._amp_after_id:
+            self.root.after_cancel(self._amp_after_id)
+        self._amp_after_id = self.root.after(80, self._send_slider_amplitude)
+        
+    def _send_slider_frequency(self):
+        """Send the frequency once the slider has settled"""
+        self._freq_after_id = None
+        self.update_frequency()
+        
+    def _send_slider_amplitude(self):
+        """Send the amplitude once the slider has settled"""
+        self._amp_after_id = None
         self.update_amplitude()
     
     def set_frequency(self, freq):
         """Set frequency from quick buttons"""
         self.freq_var.set(freq)
         self.update_frequency()
-        print(f"Quick frequency set to: {freq} Hz")  # Debug
+        log.debug("Quick frequency set to: %d Hz", freq)
     
     def update_frequency(self):
         """Send frequency update to ESP32"""
         freq = self.freq_var.get()
+        self._freq_cache = freq
         self.send_command(f"FREQ:{freq}")
-        print(f"Sending FREQ:{freq}")  # Debug
+        log.debug("Sending FREQ:%d", freq)
     
     def update_amplitude(self):
         """Send amplitude update to ESP32"""
         amp = self.amp_var.get()
+        self._amp_cache = amp
         self.send_command(f"AMP:{amp}")
-        print(f"Sending AMP:{amp}")  # Debug
+        log.debug("Sending AMP:%d", amp)
             
     def check_startup(self):
-        """Check connection on startup"""
-        ports = serial.tools.list_ports.comports()
+        """Check connection on startup, without blocking the first paint"""
+        Thread(target=self._enumerate_ports_async,
+               args=(self._startup_prompt,), daemon=True).start()
+        
+    def _startup_prompt(self, ports):
+        """Offer to connect (or enable demo mode) once ports are known"""
         esp_found = False
         
         for port in ports:
@@ -478,10 +782,20 @@ class ESP32Oscilloscope:
                 
     def refresh_ports(self):
         """Refresh COM port list"""
-        ports = [p.device for p in serial.tools.list_ports.comports()]
-        self.port_combo['values'] = ports
+        Thread(target=self._enumerate_ports_async, daemon=True).start()
+        
+    def _enumerate_ports_async(self, on_done=None):
+        """Enumerate serial ports off the Tk thread (slow on Windows)"""
+        ports = serial.tools.list_ports.comports()
+        self.root.after(0, lambda: self._apply_ports(ports, on_done))
+        
+    def _apply_ports(self, ports, on_done=None):
+        """Show enumerated ports in the port list"""
+        self.port_combo['values'] = [p.device for p in ports]
         if ports:
             self.port_combo.current(0)
+        if on_done:
+            on_done(ports)
             
     def toggle_connection(self):
         """Toggle ESP32 connection"""
@@ -559,23 +873,46 @@ class ESP32Oscilloscope:
     def send_command(self, command):
         """Send command to ESP32 or simulate in demo"""
         if self.demo_mode:
-            print(f"[DEMO] Command: {command}")
+            log.debug("[DEMO] Command: %s", command)
             return  # Commands handled locally in demo mode
             
         if not self.connected or not self.ser:
-            print(f"[NOT CONNECTED] Cannot send: {command}")
+            log.warning("[NOT CONNECTED] Cannot send: %s", command)
             return
             
-        try:
-            self.ser.write(f"{command}\n".encode())
-            time.sleep(0.05)
-            print(f"[SENT] {command}")
-        except Exception as e:
-            print(f"Command error: {e}")
+        self._tx_q.put(command)
+        
+    def _tx_worker(self):
+        """Write queued commands to the ESP32 off the Tk thread"""
+        while True:
+            # Drain everything queued; a newer value for the same setting
+            # (e.g. FREQ:) replaces the older one
+            pending = {}
+            command = self._tx_q.get()
+            while True:
+                key = command.split(':', 1)[0]
+                pending.pop(key, None)
+                pending[key] = command
+                try:
+                    command = self._tx_q.get_nowait()
+                except queue.Empty:
+                    break
+                    
+            for command in pending.values():
+                if not self.connected or not self.ser:
+                    break
+                try:
+                    self.ser.write(f"{command}\n".encode())
+                    log.debug("[SENT] %s", command)
+                except Exception as e:
+                    log.error("Command error: %s", e)
+                time.sleep(0.02)  # Spacing for the ESP32 between commands
             
     def update_waveform(self):
         """Update waveform type"""
-        self.send_command(f"WAVE:{self.wave_var.get()}")
+        wave_type = self.wave_var.get()
+        self._wave_cache = wave_type
+        self.send_command(f"WAVE:{wave_type}")
         
     def toggle_generator(self):
         """Toggle generator output"""
@@ -594,6 +931,8 @@ class ESP32Oscilloscope:
             messagebox.showwarning("Warning", 
                 "Not connected to ESP32.\n\nEnable Demo Mode to test with simulated data.")
             return
+        if self.running:
+            return  # RUN is already capturing
             
         if self.demo_mode:
             self.generate_demo_data()
@@ -602,149 +941,374 @@ class ESP32Oscilloscope:
             
     def generate_demo_data(self):
         """Generate simulated waveform"""
-        samples = 1000
-        time_data = np.linspace(0, 100, samples)
-        
-        freq = self.freq_var.get()
-        amp = self.amp_var.get() / 255.0
-        wave_type = self.wave_var.get()
-        
-        t = time_data / 1000.0
-        
-        if wave_type == "SINE":
-            signal = np.sin(2 * np.pi * freq * t)
-        elif wave_type == "SQUARE":
-            signal = np.sign(np.sin(2 * np.pi * freq * t))
-        elif wave_type == "TRIANGLE":
-            signal = 2 * np.abs(2 * ((freq * t) % 1) - 1) - 1
-        elif wave_type == "SAWTOOTH":
-            signal = 2 * ((freq * t) % 1) - 1
+        with self._produce_lock:
+            self._demo_frame()
+        # Outside the lock - after() from a worker thread waits on the Tk
+        # thread, which takes the lock itself for SINGLE
+        self._schedule_display()
+            
+    def _demo_frame(self):
+        """Build one simulated frame in the ring"""
+        time_data = self._time_axis
+        
+        freq = self._freq_cache
+        amp = self._amp_cache / 255.0
+        wave_type = self._wave_cache
+        
+        signal = self._demo_signal
+        
+        lut = self._lut.get(wave_type)
+        if lut is not None:
+            # Phase accumulator: freq * t (t in seconds) in 1/4096 cycle
+            # steps, wrapped to one period and looked up in the table
+            idx = self._demo_idx
+            np.multiply(time_data, freq * 1e-3 * len(lut), out=signal)
+            np.copyto(idx, signal, casting='unsafe')
+            np.bitwise_and(idx, len(lut) - 1, out=idx)
+            np.take(lut, idx, out=signal)
         else:
-            signal = np.zeros_like(t)
+            signal.fill(0)
             
-        voltage_data = 1.65 + amp * 1.5 * signal
-        noise = np.random.normal(0, 0.015, samples)
-        voltage_data = voltage_data + noise
+        # 15 mV of gaussian noise, drawn straight into the reused buffer
+        noise = self._rng.standard_normal(dtype=np.float32, out=self._demo_noise)
+        noise *= 0.015
         
-        with self.data_lock:
-            self.scope_data = {
-                'time': time_data.tolist(),
-                'voltage': voltage_data.tolist()
-            }
-            
-        self.root.after(0, self.update_display)
+        # 1.65 + amp * 1.5 * signal + noise, built directly in the ring
+        start, voltage_data = self._reserve_frame(len(time_data))
+        np.multiply(signal, amp * 1.5, out=voltage_data)
+        voltage_data += 1.65
+        voltage_data += noise
+        
+        self.dt = self._demo_dt
+        self._commit_frame(start, len(voltage_data))
         
     def _capture_thread(self):
-        """Capture from ESP32"""
+        """Capture from ESP32, returning False if the capture failed"""
+        with self._produce_lock:
+            ok = self._capture_frame()
+        if ok:
+            self._schedule_display()
+        return ok
+            
+    def _capture_frame(self):
+        """Read one capture from the port into the ring"""
         try:
             self.ser.write(b"SCOPE\n")
             
-            time_data = []
-            voltage_data = []
-            capturing = False
+            buf = bytearray()
+            scanned = 0
+            # Binary (payload offset, count) once its header has arrived;
+            # a SCOPE_START line means a text capture, so stop looking
+            frame = None
+            is_text = False
+            hdr_from = 0
             
-            timeout = time.time() + 5  # 5 second timeout
+            deadline = time.monotonic() + 5.0  # 5 second timeout
+            # POSIX ports can be waited on with select(); Windows COM ports
+            # raise from fileno() and use the port's blocking read instead
+            fd = None
+            if os.name == 'posix':
+                try:
+                    fd = self.ser.fileno()
+                except (AttributeError, OSError, ValueError):
+                    fd = None
             
-            while time.time() < timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode().strip()
-                    
-                    if line == "SCOPE_START":
-                        capturing = True
-                        time_data = []
-                        voltage_data = []
-                    elif line == "SCOPE_END":
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if fd is not None and not self.ser.in_waiting:
+                    ready, _, _ = select.select([fd], [], [], remaining)
+                    if not ready:
+                        break
+                # Drain everything queued (at least one byte)
+                buf += self.ser.read(self.ser.in_waiting or 1)
+                
+                # Only new bytes are searched, plus enough of the old tail
+                # to catch a marker or header line split across reads
+                if frame is None and not is_text:
+                    frame = self._binary_frame(buf, hdr_from)
+                    if frame is None:
+                        is_text = buf.find(b"SCOPE_START", hdr_from) >= 0
+                        hdr_from = max(0, len(buf) - 32)
+                if frame is not None:
+                    # Binary payload may contain any byte, so go by length
+                    offset, count = frame
+                    if len(buf) >= offset + count * SCOPE_BIN_RECORD.itemsize:
                         break
-                    elif capturing and ',' in line:
-                        try:
-                            t, v = line.split(',')
-                            time_data.append(float(t) / 1000.0)
-                            voltage_data.append(float(v))
-                        except:
-                            pass
-                            
-            with self.data_lock:
-                self.scope_data = {
-                    'time': time_data,
-                    'voltage': voltage_data
-                }
+                elif buf.find(b"SCOPE_END", scanned) >= 0:
+                    break
+                scanned = max(0, len(buf) - len(b"SCOPE_END"))
                 
-            self.root.after(0, self.update_display)
+            t_us, v_raw, v_scale = self._parse_capture(buf)
+            
+            # Scale straight into the ring slot - no intermediate arrays
+            start, v_slot = self._reserve_frame(len(v_raw))
+            n = len(v_slot)
+            np.multiply(v_raw[:n], v_scale, out=v_slot)
+            if n > 1:
+                # The ESP32 samples at a fixed rate, so its timestamps give
+                # the interval once per capture
+                if t_us.dtype == SCOPE_BIN_RECORD['t']:
+                    # 16-bit timestamps wrap, so take the span modulo 2**16
+                    span = (int(t_us[n - 1]) - int(t_us[0])) & 0xFFFF
+                else:
+                    span = float(t_us[n - 1]) - float(t_us[0])
+                self.dt = span * 1e-3 / (n - 1)
+            self._commit_frame(start, n)
+            return True
             
         except Exception as e:
-            print(f"Capture error: {e}")
+            log.error("Capture error: %s", e)
+            return False
+            
+    def _binary_frame(self, buf, start=0):
+        """Locate a binary capture frame, returning (payload offset, count)"""
+        hdr = buf.find(SCOPE_BIN_HEADER, start)
+        if hdr < 0:
+            return None
+        eol = buf.find(b"\n", hdr)
+        if eol < 0:
+            return None
+        try:
+            count = int(buf[hdr + len(SCOPE_BIN_HEADER):eol])
+        except ValueError:
+            return None
+        return eol + 1, count
+        
+    def _parse_capture(self, buf):
+        """Parse a capture frame into (time in us, raw voltage, volts per unit)"""
+        empty = np.empty(0, np.float32)
+        
+        frame = self._binary_frame(buf)
+        if frame is not None:
+            # Field views straight onto the received bytes, no copies
+            offset, count = frame
+            count = min(count, (len(buf) - offset) // SCOPE_BIN_RECORD.itemsize)
+            raw = np.frombuffer(buf, dtype=SCOPE_BIN_RECORD,
+                                count=count, offset=offset)
+            return raw['t'], raw['v'], 3.3 / 255.0
+            
+        # Text frame: SCOPE_START, "t,v" lines, SCOPE_END
+        start = buf.find(b"SCOPE_START")
+        if start < 0:
+            return empty, empty, 1.0
+        start = buf.find(b"\n", start) + 1
+        if start == 0:
+            return empty, empty, 1.0
+        end = buf.find(b"SCOPE_END", start)
+        if end < 0:
+            # Cut off mid-line by the deadline - keep only complete lines
+            end = buf.rfind(b"\n", start) + 1
+        payload = buf[start:end]
+        if not payload.strip():
+            return empty, empty, 1.0
             
+        # Convert both columns in one pass instead of float() per sample.
+        # float64, as micros() timestamps outgrow float32 precision; the
+        # voltages are narrowed when they're scaled into the ring.
+        try:
+            t, v = np.loadtxt(io.BytesIO(payload), delimiter=',',
+                              dtype=np.float64, unpack=True, ndmin=2)
+        except ValueError:
+            t, v = self._parse_capture_lenient(payload)
+            
+        return t, v, 1.0
+        
+    def _parse_capture_lenient(self, payload):
+        """Parse "t,v" lines, skipping any that aren't a pair of numbers"""
+        rows = b"\n".join(line for line in payload.split(b"\n")
+                          if line.count(b",") == 1)
+        if not rows.strip():
+            empty = np.empty(0, np.float32)
+            return empty, empty
+        data = np.genfromtxt(io.BytesIO(rows), delimiter=',',
+                             dtype=np.float64, ndmin=2)
+        data = data[~np.isnan(data).any(axis=1)]
+        return data[:, 0], data[:, 1]
+        
+    def _reserve_frame(self, n):
+        """Return (start, voltage view) of the next ring slot"""
+        n = min(n, SCOPE_MAX_SAMPLES)
+        start = self._head
+        if start + n > SCOPE_RING_SIZE:
+            start = 0  # Restart at the front so frames never wrap
+        # Never hand out samples the display is still reading
+        reading = self._reading
+        if reading is not None and start < reading[1] and reading[0] < start + n:
+            start = reading[1] if reading[1] + n <= SCOPE_RING_SIZE else 0
+        return start, self._rb_v[start:start + n]
+        
+    def _commit_frame(self, start, n):
+        """Measure a filled ring slot and make it the current frame"""
+        self._head = start + n
+        # Measured here, on the producing thread, so the Tk thread only
+        # has to show the finished readout strings
+        dt = self.dt
+        readouts = None
+        if n:
+            readouts = self._compute_measurements(self._rb_v[start:start + n], dt)
+        # Publish last - the reader only ever sees complete frames
+        self._frame = (start, n, dt, readouts)
+        
     def toggle_run(self):
         """Toggle continuous capture"""
         self.running = not self.running
         
         if self.running:
             self.run_btn.config(text="■ STOP", bg='#440000', fg='#ff0000')
-            self.auto_capture = True
-            Thread(target=self._run_thread, daemon=True).start()
+            # Each run gets its own stop event so a quick STOP/RUN can't
+            # leave the previous thread running alongside the new one
+            self._run_stop = Event()
+            Thread(target=self._run_thread, args=(self._run_stop,),
+                   daemon=True).start()
         else:
             self.run_btn.config(text="▶ RUN", bg='#004400', fg='#00ff00')
-            self.auto_capture = False
+            self._run_stop.set()
             
-    def _run_thread(self):
+    def _run_thread(self, stop):
         """Continuous capture thread"""
-        while self.running and self.auto_capture:
+        backoff = 0.5
+        while not stop.is_set():
             if self.demo_mode:
                 self.generate_demo_data()
+                # Simulated trigger rate; STOP wakes this immediately
+                stop.wait(0.5)
+            elif self.connected:
+                # Re-arm as soon as the last capture ends - the capture
+                # already waits on the port for data. A failing port backs
+                # off instead of retrying in a tight loop.
+                if self._capture_thread():
+                    backoff = 0.5
+                else:
+                    stop.wait(backoff)
+                    backoff = min(backoff * 2, 5.0)
             else:
-                if self.connected:
-                    self._capture_thread()
-            time.sleep(0.5)
+                stop.wait(0.5)
+            
+    def _schedule_display(self):
+        """Queue a display refresh, dropping it if one is already pending"""
+        if self._pending_draw:
+            return
+        self._pending_draw = True
+        # Frames arriving faster than the refresh cap fold into one redraw
+        delay = self._last_draw + SCOPE_REFRESH_INTERVAL - time.monotonic()
+        if delay > 0:
+            self.root.after(int(delay * 1000) + 1, self._do_update)
+        else:
+            self.root.after_idle(self._do_update)
+        
+    def _do_update(self):
+        """Run the queued display refresh with the latest data"""
+        self._pending_draw = False
+        self._last_draw = time.monotonic()
+        self.update_display()
             
     def update_display(self):
         """Update oscilloscope display"""
-        with self.data_lock:
-            time_data = self.scope_data['time']
-            voltage_data = self.scope_data['voltage']
-            
-        if not time_data:
+        start, n, dt, readouts = self._frame
+        if not n:
             return
             
-        # Update waveform
-        self.line.set_data(time_data, voltage_data)
-        self.ax.set_xlim(min(time_data), max(time_data))
-        self.canvas.draw()
+        self._reading = (start, start + n)
+        try:
+            self._draw_frame(start, n, dt)
+        finally:
+            self._reading = None
+        self.update_measurements(readouts)
+        
+    def _draw_frame(self, start, n, dt):
+        """Plot the ring frame starting at start"""
+        voltage_data = self._rb_v[start:start + n]
+            
+        # Update waveform - decimated for plotting, measurements below
+        # still use every sample
+        buckets = self._plot_buckets
+        xlim = (0.0, (n - 1) * dt)
+        line_key = (n, buckets, dt)
+        if line_key != self._line_key or xlim != self._xlim_cached:
+            # New time grid - build it from the sample index
+            time_data = self._sample_index[:n] * np.float32(dt)
+            plot_t, plot_v = decimate_minmax(time_data, voltage_data, buckets)
+            self.line.set_data(plot_t, plot_v)
+            self._line_key = line_key
+        else:
+            # Same time grid as the last frame - keep the trace's x data
+            # and only rebuild the samples
+            _, plot_v = decimate_minmax(None, voltage_data, buckets)
+            self.line.set_ydata(plot_v)
+            
+        if self._bg is None or xlim != self._xlim_cached:
+            # Axes changed - full redraw, which also recaches the background
+            self._xlim_cached = xlim
+            self.ax.set_xlim(*xlim)
+            self.canvas.draw()
+        else:
+            self._blit_trace()
         
-        # Calculate measurements
-        v_max = max(voltage_data)
-        v_min = min(voltage_data)
-        v_pp = v_max - v_min
-        v_avg = np.mean(voltage_data)
+    def _blit_trace(self):
+        """Redraw only the trace over the cached axes background"""
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
         
-        # Frequency estimation
-        crossings = 0
-        for i in range(1, len(voltage_data)):
-            if voltage_data[i-1] < v_avg <= voltage_data[i]:
-                crossings += 1
-                
-        duration = time_data[-1] - time_data[0]
-        freq = (crossings / duration) * 1000 if duration > 0 else 0
+    def _compute_measurements(self, voltage_data, dt):
+        """Measure a frame, returning the formatted readout strings"""
+        v = np.ascontiguousarray(voltage_data, dtype=np.float32)
         
-        # Update measurement displays
-        self.meas_labels['vmax'].config(text=f"{v_max:.3f}")
-        self.meas_labels['vmin'].config(text=f"{v_min:.3f}")
-        self.meas_labels['vpp'].config(text=f"{v_pp:.3f}")
-        self.meas_labels['vavg'].config(text=f"{v_avg:.3f}")
-        self.meas_labels['freq'].config(text=f"{freq:.1f}")
+        # All statistics in one kernel over the contiguous frame
+        v_min, v_max, v_avg, crossings = scope_stats(v)
+        v_pp = v_max - v_min
+        
+        # Frequency estimation - FFT peak; a frame that never crosses its
+        # mean has no cycle to measure
+        duration = (len(v) - 1) * dt
+        if duration > 0 and crossings:
+            freq = estimate_frequency(v, v_avg, dt) * 1000
+        else:
+            freq = 0
+        
+        return self._format_readouts(v_max, v_min, v_pp, v_avg, freq)
+        
+    def _format_readouts(self, v_max, v_min, v_pp, v_avg, freq):
+        """Format all readouts, reusing the last texts if none changed"""
+        # Compare the formatted line itself, so reuse follows exactly the
+        # rounding the display uses
+        text = SCOPE_READOUT_FORMAT.format_map({
+            'vmax': v_max, 'vmin': v_min, 'vpp': v_pp, 'vavg': v_avg, 'freq': freq,
+        })
+        if text != self._readout_text:
+            self._readouts = dict(zip(SCOPE_READOUT_KEYS, text.split("|")))
+            self._readout_text = text
+        return self._readouts
+        
+    def update_measurements(self, readouts):
+        """Update measurement displays"""
+        shown = self._meas_text
+        meas_vars = self.meas_vars
+        for key, text in readouts.items():
+            if shown[key] != text:
+                shown[key] = text
+                meas_vars[key].set(text)
         
     def clear_display(self):
         """Clear display"""
-        with self.data_lock:
-            self.scope_data = {'time': [], 'voltage': []}
+        self._frame = (self._head, 0, 0.0, None)
             
         self.line.set_data([], [])
-        self.ax.set_xlim(0, 100)
-        self.canvas.draw()
+        self._line_key = (0, 0, 0.0)
+        if self._bg is not None and self._xlim_cached == (0, 100):
+            # Axes unchanged - just blit the empty trace
+            self._blit_trace()
+        else:
+            self.ax.set_xlim(0, 100)
+            self._xlim_cached = (0, 100)
+            self.canvas.draw()
         
-        for label in self.meas_labels.values():
-            label.config(text="----")
+        self.update_measurements(dict.fromkeys(self.meas_vars, "----"))
 
 def main():
+    logging.basicConfig(level=logging.WARNING)
     root = tk.Tk()
     app = ESP32Oscilloscope(root)
     root.mainloop()